@@ -4,14 +4,19 @@
 from __future__ import annotations
 
 import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Library imports
 import numpy as np
 
 # Local imports
 from tec_model.cui_devices_cp35 import CP353047, CP354047
+from tec_model.thermoelectric_cooler import select_backend
 
 # Typing imports
+if TYPE_CHECKING:
+    from matplotlib.typing import LineStyleType
 
 logger = logging.getLogger(__name__)
 
@@ -20,22 +25,30 @@ hot_side_sink_rj = 0.5  # °C/W
 
 t_cold = 5 + 273.15  # K
 
-currents = np.linspace(1, 5.0, 20).tolist()
-
-t_hots = np.linspace(27 + 273.15, 55 + 273.15, 6).tolist()
-
-
-CP353047.plot_operating_regions(
-    t_cold=t_cold,
-    t_hots=t_hots,
-    currents=currents,
-    hot_side_sink_rj=hot_side_sink_rj,
-)
-
-
-CP354047.plot_operating_regions(
-    t_cold=t_cold,
-    t_hots=t_hots,
-    currents=currents,
-    hot_side_sink_rj=hot_side_sink_rj,
-)
+currents = np.linspace(1, 5.0, 20)
+
+t_hots = np.linspace(27 + 273.15, 55 + 273.15, 6)
+
+
+if __name__ == "__main__":
+    # The backend has to be picked before pyplot is imported for it to take effect.
+    select_backend()
+    import matplotlib.pyplot as plt
+
+    # Plot the modules into one shared figure so they can be compared directly.
+    fig, axes = plt.subplots(2, 3, figsize=(22, 15))
+    fig.suptitle(f"CP353047 vs CP354047 operating points.\nTc = {t_cold - 273.15}°C.")
+    linestyles: list[LineStyleType] = ["-", "--"]
+    for tec, linestyle in zip([CP353047, CP354047], linestyles, strict=True):
+        tec.plot_operating_regions(
+            t_cold=t_cold,
+            t_hots=t_hots,
+            currents=currents,
+            hot_side_sink_rj=hot_side_sink_rj,
+            ax_grid=axes.flat,
+            linestyle=linestyle,
+        )
+
+    output_path = Path("plots/CP353047_vs_CP354047.png")
+    fig.savefig(str(output_path.absolute()), dpi=120, bbox_inches="tight")
+    plt.close(fig)
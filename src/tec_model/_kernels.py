@@ -0,0 +1,56 @@
+"""Numba compiled kernels for calculating operating points of TEC modules.
+
+These mirror the equations in `tec_model.thermoelectric_cooler` but take the module
+parameters as plain floats so that they can be JIT compiled. Only the grid sweep is
+compiled, for a single operating point the numba dispatch costs more than the maths.
+Numba is an optional dependency (`poetry install --extras jit`), so this module should
+only be imported behind a guard for `ImportError`.
+"""
+
+# System imports
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+# Library imports
+from numba import njit, prange
+
+# Local imports
+
+# Typing imports
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def sweep(
+    currents: npt.NDArray[np.float64],
+    t_hots: npt.NDArray[np.float64],
+    t_cold: float,
+    v_max: float,
+    i_max: float,
+    delta_t_max: float,
+    voltages: npt.NDArray[np.float64],
+    cooling_powers: npt.NDArray[np.float64],
+    cops: npt.NDArray[np.float64],
+) -> None:
+    """Calculate the voltage, cooling power and COP over a grid of operating points.
+
+    The outputs are filled in place and have one row per hot side temp and one column
+    per current. Rows are calculated in parallel and no intermediate arrays are created.
+    """
+    for row in prange(t_hots.shape[0]):
+        t_hot = t_hots[row]
+        t_hot_minus_d_t_m = t_hot - delta_t_max
+        r = t_hot_minus_d_t_m * v_max / (t_hot * i_max)
+        s_m = v_max / t_hot
+        k_m = t_hot_minus_d_t_m * v_max * i_max / (2 * t_hot * delta_t_max)
+        dt = t_hot - t_cold
+        for col in range(currents.shape[0]):
+            current = currents[col]
+            v = s_m * dt + r * current
+            q = (s_m * t_cold * current) - (0.5 * current * current * r) - (k_m * dt)
+            voltages[row, col] = v
+            cooling_powers[row, col] = q
+            cops[row, col] = q / (v * current)
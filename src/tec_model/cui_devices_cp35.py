@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 CP35_DATASHEET_LINK = "https://www.cuidevices.com/product/resource/cp35.pdf"
 
-CP35147 = ThermoElectricCooler(
+CP35147 = ThermoElectricCooler.from_datasheet(
     mfn="CP35147",
     datasheet_link=CP35_DATASHEET_LINK,
     v_max=2.1,
@@ -26,7 +26,7 @@ CP35147 = ThermoElectricCooler(
     delta_t_max_50=75,
 )
 
-CP35247 = ThermoElectricCooler(
+CP35247 = ThermoElectricCooler.from_datasheet(
     mfn="CP35247",
     datasheet_link=CP35_DATASHEET_LINK,
     v_max=3.8,
@@ -37,7 +37,7 @@ CP35247 = ThermoElectricCooler(
     delta_t_max_50=75,
 )
 
-CP35301547 = ThermoElectricCooler(
+CP35301547 = ThermoElectricCooler.from_datasheet(
     mfn="CP35301547",
     datasheet_link=CP35_DATASHEET_LINK,
     v_max=4.2,
@@ -48,7 +48,7 @@ CP35301547 = ThermoElectricCooler(
     delta_t_max_50=75,
 )
 
-CP35347 = ThermoElectricCooler(
+CP35347 = ThermoElectricCooler.from_datasheet(
     mfn="CP35347",
     datasheet_link=CP35_DATASHEET_LINK,
     v_max=8.6,
@@ -59,7 +59,7 @@ CP35347 = ThermoElectricCooler(
     delta_t_max_50=77,
 )
 
-CP353047 = ThermoElectricCooler(
+CP353047 = ThermoElectricCooler.from_datasheet(
     mfn="CP353047",
     datasheet_link=CP35_DATASHEET_LINK,
     v_max=11.8,
@@ -70,7 +70,7 @@ CP353047 = ThermoElectricCooler(
     delta_t_max_50=77.0,
 )
 
-CP35447 = ThermoElectricCooler(
+CP35447 = ThermoElectricCooler.from_datasheet(
     mfn="CP353047",
     datasheet_link=CP35_DATASHEET_LINK,
     v_max=15.4,
@@ -81,7 +81,7 @@ CP35447 = ThermoElectricCooler(
     delta_t_max_50=77.0,
 )
 
-CP354047 = ThermoElectricCooler(
+CP354047 = ThermoElectricCooler.from_datasheet(
     mfn="CP354047",
     datasheet_link=CP35_DATASHEET_LINK,
     v_max=24.1,
@@ -0,0 +1,117 @@
+"""Module for calculating operating points of many TEC modules at once.
+
+See `tec_model.thermoelectric_cooler` for the equations used.
+"""
+
+# System imports
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+# Library imports
+import numpy as np
+
+# Local imports
+from tec_model.thermoelectric_cooler import (
+    broadcast_ambient_temperatures,
+    broadcast_operating_params,
+)
+
+# Typing imports
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy.typing as npt
+
+    from tec_model.thermoelectric_cooler import ThermoElectricCooler
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class TECBank:
+    """Struct of arrays of TEC module parameters for sweeping many modules at once.
+
+    Each array has one entry per module, in the same order as `mfns`. See
+    `ThermoElectricCooler` for the meaning of each field.
+    """
+
+    mfns: tuple[str, ...]
+    v_max: npt.NDArray[np.float64]
+    i_max: npt.NDArray[np.float64]
+    q_max_27: npt.NDArray[np.float64]
+    q_max_50: npt.NDArray[np.float64]
+    delta_t_max_27: npt.NDArray[np.float64]
+    delta_t_max_50: npt.NDArray[np.float64]
+
+    @classmethod
+    def from_models(cls, models: Iterable[ThermoElectricCooler]) -> TECBank:
+        """Pack the parameters of several TEC modules into a bank."""
+        models = list(models)
+
+        def pack(field: str) -> npt.NDArray[np.float64]:
+            return np.array([getattr(model, field) for model in models], dtype=float)
+
+        return cls(
+            mfns=tuple(model.mfn for model in models),
+            v_max=pack("v_max"),
+            i_max=pack("i_max"),
+            q_max_27=pack("q_max_27"),
+            q_max_50=pack("q_max_50"),
+            delta_t_max_27=pack("delta_t_max_27"),
+            delta_t_max_50=pack("delta_t_max_50"),
+        )
+
+    def __len__(self) -> int:
+        """Number of modules in the bank."""
+        return len(self.mfns)
+
+    def sweep(
+        self,
+        currents: npt.ArrayLike,
+        t_hots: npt.ArrayLike,
+        t_cold: float,
+    ) -> tuple[
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+    ]:
+        """Calculate the operating points of every module in the bank over a grid.
+
+        Equivalent to calling `ThermoElectricCooler.operating_params_vec` for each
+        module. Each returned array is indexed by `[module, t_hot, current]`.
+        """
+        return broadcast_operating_params(
+            currents=np.asarray(currents, dtype=np.float64)[np.newaxis, np.newaxis, :],
+            t_hots=np.asarray(t_hots, dtype=np.float64)[np.newaxis, :, np.newaxis],
+            t_cold=t_cold,
+            v_max=self.v_max[:, np.newaxis, np.newaxis],
+            i_max=self.i_max[:, np.newaxis, np.newaxis],
+            delta_t_max=self.delta_t_max_27[:, np.newaxis, np.newaxis],
+        )
+
+    def ambient_temperatures(
+        self,
+        currents: npt.ArrayLike,
+        t_hots: npt.ArrayLike,
+        t_cold: float,
+        hot_side_sink_rj: float,
+    ) -> npt.NDArray[np.float64]:
+        """Calculate the ambient temps [K] of every module in the bank over a grid.
+
+        Equivalent to calling `ThermoElectricCooler.ambient_temperature_vec` for each
+        module. The returned array is indexed by `[module, t_hot, current]`.
+        """
+        return broadcast_ambient_temperatures(
+            currents=np.asarray(currents, dtype=np.float64)[np.newaxis, np.newaxis, :],
+            t_hots=np.asarray(t_hots, dtype=np.float64)[np.newaxis, :, np.newaxis],
+            t_cold=t_cold,
+            v_max=self.v_max[:, np.newaxis, np.newaxis],
+            i_max=self.i_max[:, np.newaxis, np.newaxis],
+            delta_t_max=self.delta_t_max_27[:, np.newaxis, np.newaxis],
+            hot_side_sink_rj=hot_side_sink_rj,
+        )
@@ -7,64 +7,120 @@ https://www.electronics-cooling.com/2008/08/a-simple-method-to-estimate-the-phys
 # System imports
 from __future__ import annotations
 
+import functools
 import logging
+import math
+import os
+import sys
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, NamedTuple
 
 # Library imports
-import matplotlib.pyplot as plt
-from matplotlib.axes import Axes
-from pydantic import BaseModel, Field
+import numpy as np
 
 # Local imports
 
 # Typing imports
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from types import ModuleType
 
+    import numpy.typing as npt
+    from matplotlib.artist import Artist
+    from matplotlib.axes import Axes
+    from matplotlib.lines import Line2D
+    from matplotlib.typing import LineStyleType
 
-logger = logging.getLogger(__name__)
 
+logger = logging.getLogger(__name__)
 
-class ThermoElectricCooler(BaseModel):
-    """Definition of a TEC (ThermoElectric Cooler) module."""
 
-    mfn: str = Field(
-        description="The manufacturers part number for the device.",
-    )
-    datasheet_link: str = Field(description="Link to the datasheet for the device.")
-    v_max: float = Field(
-        description=(
-            "Voltage [V] operating point for max delta T and hot side temp of 27°C."
-        )
-    )
-    i_max: float = Field(
-        description=(
-            "Current [A] operating point for max delta T and hot side temp of 27°C."
-        )
-    )
-    q_max_27: float = Field(
-        description=(
-            "Max cooling capacity [W] when operating at i_max and v_max and hot side "
-            "temp of 27°C and delta T of 0°C."
-        )
-    )
-    q_max_50: float = Field(
-        description=(
-            "Max cooling capacity [W] when operating at i_max and v_max and hot side "
-            "temp of 50°C and delta T of 0°C."
-        )
-    )
-    delta_t_max_27: float = Field(
-        description=(
-            "Max delta T from hot side to cool side [°C/°K] when operating at i_max "
-            "and v_max and hot side temp of 27°C and 0W."
-        )
-    )
-    delta_t_max_50: float = Field(
-        description=(
-            "Max delta T from hot side to cool side [°C/°K] when operating at i_max "
-            "and v_max and hot side temp of 50°C and 0W."
-        )
-    )
+class _Coefficients(NamedTuple):
+    """TEC module coefficients that only depend on the hot side temp."""
+
+    r: float
+    s_m: float
+    k_m: float
+    fom: float
+
+
+@dataclass(frozen=True, slots=True)
+class ThermoElectricCooler:
+    """Definition of a TEC (ThermoElectric Cooler) module.
+
+    Instances are frozen so that they are hashable and can be used as cache keys. The
+    fields aren't validated on construction, use `from_datasheet` for that.
+
+    Attributes:
+        mfn: The manufacturers part number for the device.
+        datasheet_link: Link to the datasheet for the device.
+        v_max: Voltage [V] operating point for max delta T and hot side temp of 27°C.
+        i_max: Current [A] operating point for max delta T and hot side temp of 27°C.
+        q_max_27: Max cooling capacity [W] when operating at i_max and v_max and hot
+            side temp of 27°C and delta T of 0°C.
+        q_max_50: Max cooling capacity [W] when operating at i_max and v_max and hot
+            side temp of 50°C and delta T of 0°C.
+        delta_t_max_27: Max delta T from hot side to cool side [°C/°K] when operating
+            at i_max and v_max and hot side temp of 27°C and 0W.
+        delta_t_max_50: Max delta T from hot side to cool side [°C/°K] when operating
+            at i_max and v_max and hot side temp of 50°C and 0W.
+    """
+
+    mfn: str
+    datasheet_link: str
+    v_max: float
+    i_max: float
+    q_max_27: float
+    q_max_50: float
+    delta_t_max_27: float
+    delta_t_max_50: float
+
+    @classmethod
+    def from_datasheet(cls, **values: object) -> ThermoElectricCooler:
+        """Create a TEC module from its datasheet values, validating them once.
+
+        Numeric values are converted to floats and must be positive and finite.
+
+        Raises:
+            TypeError: If a field is missing, unknown or of the wrong type.
+            ValueError: If a numeric field isn't positive and finite.
+        """
+        validated: dict[str, str | float] = {}
+        for field in fields(cls):
+            if field.name not in values:
+                msg = f"Missing datasheet value: {field.name}."
+                raise TypeError(msg)
+            value = values.pop(field.name)
+
+            # The annotation is a string while annotations are postponed.
+            if field.type in (str, "str"):
+                if not isinstance(value, str):
+                    msg = f"{field.name} must be a str, got {value!r}."
+                    raise TypeError(msg)
+                validated[field.name] = value
+                continue
+
+            if isinstance(value, bool) or not isinstance(value, int | float):
+                msg = f"{field.name} must be a number, got {value!r}."
+                raise TypeError(msg)
+            if not math.isfinite(value) or value <= 0:
+                msg = f"{field.name} must be positive and finite, got {value!r}."
+                raise ValueError(msg)
+            validated[field.name] = float(value)
+
+        if values:
+            msg = f"Unknown datasheet values: {', '.join(values)}."
+            raise TypeError(msg)
+
+        return cls(**validated)  # type: ignore[arg-type]
+
+    def model_dump(self) -> dict[str, str | float]:
+        """Return the fields of the TEC module as a dict.
+
+        Kept for compatibility with code written against the old pydantic model.
+        """
+        return asdict(self)
 
     def figure_of_merit(self, t_hot: float) -> float:
         """Calc the figure of merit of the TEC module at a given hot side temp.
@@ -96,14 +152,46 @@ class ThermoElectricCooler(BaseModel):
         """
         return (t_hot - self.delta_t_max_27) * self.v_max / (t_hot * self.i_max)
 
+    def _coeffs(self, t_hot: float) -> _Coefficients:
+        """Look up the coefficients of the TEC module at a hot side temp.
+
+        Scalar hot side temps go through the cache, arrays aren't hashable so their
+        coefficients are calculated directly.
+        """
+        try:
+            return self._cached_coeffs(t_hot)
+        except TypeError:
+            return self._calc_coeffs(t_hot)
+
+    def _calc_coeffs(self, t_hot: float) -> _Coefficients:
+        """Calc the coefficients of the TEC module at a hot side temp.
+
+        Inlines EQNs 19-22 from the reference link at top of file so that the shared
+        `t_hot - delta_t_max_27` term is only calculated once.
+        """
+        d_t_m = self.delta_t_max_27
+        t_hot_minus_d_t_m = t_hot - d_t_m
+        return _Coefficients(
+            r=t_hot_minus_d_t_m * self.v_max / (t_hot * self.i_max),
+            s_m=self.v_max / t_hot,
+            k_m=t_hot_minus_d_t_m * self.v_max * self.i_max / (2 * t_hot * d_t_m),
+            fom=2 * d_t_m / t_hot_minus_d_t_m**2,
+        )
+
+    _cached_coeffs = functools.lru_cache(maxsize=4096)(_calc_coeffs)
+
     def cooling_power(self, current: float, t_hot: float, t_cold: float) -> float:
         """Calculate the cooling power of the TEC module.
 
         See reference link at top of file: EQN 8.
         """
-        r = self.module_resistance(t_hot=t_hot)
-        s_m = self.seebeck_coefficient(t_hot=t_hot)
-        k_m = self.thermal_conductance(t_hot=t_hot)
+        # The coefficients are calculated inline as for a single quantity that's
+        # cheaper than hashing the module to look them up in the `_coeffs` cache.
+        d_t_m = self.delta_t_max_27
+        t_hot_minus_d_t_m = t_hot - d_t_m
+        r = t_hot_minus_d_t_m * self.v_max / (t_hot * self.i_max)
+        s_m = self.v_max / t_hot
+        k_m = t_hot_minus_d_t_m * self.v_max * self.i_max / (2 * t_hot * d_t_m)
         i = current
         dt = t_hot - t_cold
 
@@ -114,9 +202,10 @@ class ThermoElectricCooler(BaseModel):
 
         See reference link at top of file: EQN 9.
         """
-        r = self.module_resistance(t_hot=t_hot)
+        # See `cooling_power` for why the coefficients are calculated inline.
+        r = (t_hot - self.delta_t_max_27) * self.v_max / (t_hot * self.i_max)
+        s_m = self.v_max / t_hot
         i = current
-        s_m = self.seebeck_coefficient(t_hot=t_hot)
         dt = t_hot - t_cold
 
         return s_m * dt + r * i
@@ -124,15 +213,152 @@ class ThermoElectricCooler(BaseModel):
     def operating_params(
         self, current: float, t_hot: float, t_cold: float
     ) -> tuple[float, float, float, float]:
-        """Calculate the operating point of the TEC module."""
-        voltage = self.voltage(current=current, t_hot=t_hot, t_cold=t_cold)
-        electrical_power = voltage * current
-        cooling_power = self.cooling_power(current=current, t_hot=t_hot, t_cold=t_cold)
-        figure_of_merit = self.figure_of_merit(t_hot=t_hot)
+        """Calculate the operating point of the TEC module.
+
+        Results for scalar inputs are cached since parametric studies tend to query the
+        same operating points repeatedly. Arrays aren't hashable so they're calculated
+        directly, `operating_params_vec` is faster for grids of operating points. The
+        cache holds a reference to each module it has seen, use
+        `ThermoElectricCooler.cache_clear()` to reset it.
+        """
+        try:
+            return self._cached_operating_params(current, t_hot, t_cold)
+        except TypeError:
+            return self._calc_operating_params(current, t_hot, t_cold)
+
+    def _calc_operating_params(
+        self, current: float, t_hot: float, t_cold: float
+    ) -> tuple[float, float, float, float]:
+        """Calc the operating point of the TEC module.
+
+        Fuses EQNs 8, 9 and 10 from the reference link at top of file so that the
+        coefficients are only looked up once per operating point.
+        """
+        r, s_m, k_m, figure_of_merit = self._coeffs(t_hot)
+        i = current
+        dt = t_hot - t_cold
+
+        voltage = s_m * dt + r * i
+        cooling_power = (s_m * t_cold * i) - (0.5 * i**2 * r) - (k_m * dt)
 
-        coefficient_of_performance = cooling_power / electrical_power
+        coefficient_of_performance = cooling_power / (voltage * i)
         return voltage, cooling_power, coefficient_of_performance, figure_of_merit
 
+    _cached_operating_params = functools.lru_cache(maxsize=4096)(_calc_operating_params)
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear the cached coefficients and operating points of all TEC modules."""
+        ThermoElectricCooler._cached_coeffs.cache_clear()
+        ThermoElectricCooler._cached_operating_params.cache_clear()
+
+    def ambient_temperature(
+        self, current: float, t_hot: float, t_cold: float, hot_side_sink_rj: float
+    ) -> float:
+        """Calculate the ambient temp [K] needed to hold the hot side at `t_hot`.
+
+        The heat sink has to reject the input power plus the cooling power, V * I + Q.
+        Substituting EQNs 8 and 9 from the reference link at top of file, that
+        simplifies to s_m * t_hot * I + 0.5 * r * I^2 - k_m * dt, so the voltage and
+        cooling power don't need to be calculated first.
+        """
+        r, s_m, k_m, _ = self._coeffs(t_hot)
+        i = current
+        dt = t_hot - t_cold
+
+        heat_rejected = (s_m * t_hot * i) + (0.5 * r * i**2) - (k_m * dt)
+        return t_hot - heat_rejected * hot_side_sink_rj
+
+    def operating_params_vec(
+        self,
+        currents: npt.ArrayLike,
+        t_hots: npt.ArrayLike,
+        t_cold: float,
+    ) -> tuple[
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+    ]:
+        """Calculate the operating points of the TEC module over a grid.
+
+        Vectorised equivalent of `operating_params`. Each returned array has one row
+        per hot side temp in `t_hots` and one column per current in `currents`.
+        """
+        return broadcast_operating_params(
+            currents=np.asarray(currents, dtype=np.float64)[np.newaxis, :],
+            t_hots=np.asarray(t_hots, dtype=np.float64)[:, np.newaxis],
+            t_cold=t_cold,
+            v_max=np.asarray(self.v_max),
+            i_max=np.asarray(self.i_max),
+            delta_t_max=np.asarray(self.delta_t_max_27),
+        )
+
+    def ambient_temperature_vec(
+        self,
+        currents: npt.ArrayLike,
+        t_hots: npt.ArrayLike,
+        t_cold: float,
+        hot_side_sink_rj: float,
+    ) -> npt.NDArray[np.float64]:
+        """Calculate the ambient temps [K] to hold the hot side temps over a grid.
+
+        Vectorised equivalent of `ambient_temperature`, laid out like
+        `operating_params_vec`.
+        """
+        return broadcast_ambient_temperatures(
+            currents=np.asarray(currents, dtype=np.float64)[np.newaxis, :],
+            t_hots=np.asarray(t_hots, dtype=np.float64)[:, np.newaxis],
+            t_cold=t_cold,
+            v_max=np.asarray(self.v_max),
+            i_max=np.asarray(self.i_max),
+            delta_t_max=np.asarray(self.delta_t_max_27),
+            hot_side_sink_rj=hot_side_sink_rj,
+        )
+
+    def operating_params_batch(
+        self,
+        currents: npt.ArrayLike,
+        t_hots: npt.ArrayLike,
+        t_cold: float,
+    ) -> tuple[
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+    ]:
+        """Calculate the voltage, cooling power and COP of the TEC module over a grid.
+
+        Uses the compiled kernel when numba is installed, otherwise falls back to
+        `operating_params_vec`. Each returned array has one row per hot side temp in
+        `t_hots` and one column per current in `currents`.
+        """
+        current_arr = np.asarray(currents, dtype=np.float64)
+        t_hot_arr = np.asarray(t_hots, dtype=np.float64)
+
+        kernels = _load_kernels()
+        if kernels is None:
+            voltages, cooling_powers, cops, _ = self.operating_params_vec(
+                currents=current_arr, t_hots=t_hot_arr, t_cold=t_cold
+            )
+            return voltages, cooling_powers, cops
+
+        shape = (len(t_hot_arr), len(current_arr))
+        voltages = np.empty(shape)
+        cooling_powers = np.empty(shape)
+        cops = np.empty(shape)
+        kernels.sweep(
+            current_arr,
+            t_hot_arr,
+            float(t_cold),
+            float(self.v_max),
+            float(self.i_max),
+            float(self.delta_t_max_27),
+            voltages,
+            cooling_powers,
+            cops,
+        )
+        return voltages, cooling_powers, cops
+
     def coefficient_of_performance(
         self, current: float, t_hot: float, t_cold: float
     ) -> float:
@@ -146,25 +372,39 @@ class ThermoElectricCooler(BaseModel):
 
         return cooling_power / electrical_power
 
-    def plot_operating_regions(
+    def plot_operating_regions(  # noqa: PLR0913
         self,
         t_cold: float,
-        currents: list[float],
-        t_hots: list[float],
+        currents: npt.NDArray[np.float64] | Sequence[float],
+        t_hots: npt.NDArray[np.float64] | Sequence[float],
         hot_side_sink_rj: float,
+        ax_grid: Iterable[Axes] | None = None,
+        linestyle: LineStyleType = "-",
     ) -> None:
-        """Plot the operating regions of the TEC module."""
-        fig, ((ax1, ax2, ax3), (ax4, ax5, ax6)) = plt.subplots(  # type: ignore[misc]
-            2, 3, figsize=(22, 15)
-        )
-        ax1 = cast(Axes, ax1)
-        ax2 = cast(Axes, ax2)
-        ax3 = cast(Axes, ax3)
-        ax4 = cast(Axes, ax4)
-        ax5 = cast(Axes, ax5)
-        ax6 = cast(Axes, ax6)
-
-        fig.suptitle(f"{self.mfn} operating points.\nTc = {t_cold - 273.15}°C.")
+        """Plot the operating regions of the TEC module.
+
+        By default a new figure is created and saved to `plots/<mfn>.png`. If `ax_grid`
+        is given (e.g. `axes.flat` from a 2x3 `plt.subplots`) the operating regions are
+        drawn into those six axes instead, labelled with the part number, and saving the
+        figure is left to the caller. Use a different `linestyle` for each module when
+        sharing axes between them.
+        """
+        # matplotlib is only imported when plotting so that pure compute use of this
+        # module doesn't pay for importing it.
+        select_backend()
+        import matplotlib.pyplot as plt  # noqa: PLC0415
+        from matplotlib.colors import to_rgba_array  # noqa: PLC0415
+        from matplotlib.lines import Line2D  # noqa: PLC0415
+
+        save_figure = ax_grid is None
+        label_prefix = "" if save_figure else f"{self.mfn} "
+        if ax_grid is None:
+            fig, axes = plt.subplots(2, 3, figsize=(22, 15))
+            fig.suptitle(f"{self.mfn} operating points.\nTc = {t_cold - 273.15}°C.")
+            ax_grid = axes.flat
+
+        ax1, ax2, ax3, ax4, ax5, ax6 = ax_grid
+
         ax1.set_xlabel("Current (A)")
         ax2.set_xlabel("Current (A)")
         ax3.set_xlabel("Current (A)")
@@ -178,56 +418,197 @@ class ThermoElectricCooler(BaseModel):
         ax4.set_ylabel("Ambient Temperature (°C)")
         ax5.set_ylabel("Figure of Merit")
 
-        colors = [f"C{i}" for i in range(len(t_hots))]
-
-        line_vs = []
-        line_qs = []
-        line_cops = []
-        line_t_ambients = []
-        line_figure_of_merits = []
-
-        for t_hot, color in zip(t_hots, colors, strict=True):
-            voltages: list[float] = []
-            cooling_powers: list[float] = []
-            cops: list[float] = []
-            t_ambients: list[float] = []
-            figure_of_merits: list[float] = []
-
-            for current in currents:
-                voltage, cooling_power, cop, figure_of_merit = self.operating_params(
-                    current=current, t_hot=t_hot, t_cold=t_cold
-                )
-                input_power = voltage * current
-                t_ambient = t_hot - (input_power + cooling_power) * hot_side_sink_rj
-                t_ambient_c = t_ambient - 273.15
-
-                voltages.append(voltage)
-                cooling_powers.append(cooling_power)
-                cops.append(cop)
-                t_ambients.append(t_ambient_c)
-                figure_of_merits.append(figure_of_merit)
-
-            t_hot_c = t_hot - 273.15
-            label = f"Th = {t_hot_c:.2f}°C"
-            line_v = ax1.plot(currents, voltages, f"{color}o-", label=label)
-            line_q = ax2.plot(currents, cooling_powers, f"{color}o-", label=label)
-            line_cop = ax3.plot(currents, cops, f"{color}o-", label=label)
-            line_t_ambient = ax4.plot(currents, t_ambients, f"{color}o-", label=label)
-            line_figure_of_merit = ax5.plot(
-                currents, figure_of_merits, f"{color}o-", label=label
-            )
-
-            line_vs += line_v
-            line_qs += line_q
-            line_cops += line_cop
-            line_t_ambients += line_t_ambient
-            line_figure_of_merits += line_figure_of_merit
+        current_arr = np.asarray(currents, dtype=np.float64)
+        t_hot_arr = np.asarray(t_hots, dtype=np.float64)
 
-        ax1.legend(handles=line_vs)
-        ax2.legend(handles=line_qs)
-        ax3.legend(handles=line_cops)
-        ax4.legend(handles=line_t_ambients)
-        ax5.legend(handles=line_figure_of_merits)
+        voltages, cooling_powers, cops, figure_of_merits = self.operating_params_vec(
+            currents=current_arr, t_hots=t_hot_arr, t_cold=t_cold
+        )
 
-        output_path = Path(f"plots/{self.mfn}.png")
-        plt.savefig(str(output_path.absolute()))
+        # Fill the ambient temps in place rather than allocating a new array for each
+        # step of the expression.
+        t_ambients = np.empty_like(voltages)
+        np.multiply(voltages, current_arr, out=t_ambients)
+        t_ambients += cooling_powers
+        t_ambients *= -hot_side_sink_rj
+        t_ambients += t_hot_arr[:, np.newaxis] - 273.15
+
+        # Resolve the colour cycle to RGBA once rather than having matplotlib parse the
+        # "C<n>" strings again for every row and point on every axis.
+        colors = to_rgba_array([f"C{i}" for i in range(len(t_hot_arr))])
+        # The legend entries are the same for every axis so only build them once.
+        handles = [
+            Line2D(
+                [],
+                [],
+                color=color,
+                marker="o",
+                linestyle=linestyle,
+                label=f"{label_prefix}Th = {t_hot - 273.15:.2f}°C",
+            )
+            for t_hot, color in zip(t_hot_arr, colors, strict=True)
+        ]
+
+        _plot_rows(ax1, current_arr, voltages, colors, handles, linestyle)
+        _plot_rows(ax2, current_arr, cooling_powers, colors, handles, linestyle)
+        _plot_rows(ax3, current_arr, cops, colors, handles, linestyle)
+        _plot_rows(ax4, current_arr, t_ambients, colors, handles, linestyle)
+        _plot_rows(ax5, current_arr, figure_of_merits, colors, handles, linestyle)
+
+        if save_figure:
+            output_path = Path(f"plots/{self.mfn}.png")
+            fig.savefig(str(output_path.absolute()), dpi=120, bbox_inches="tight")
+            plt.close(fig)
+
+
+def broadcast_operating_params(  # noqa: PLR0913
+    currents: npt.NDArray[np.float64],
+    t_hots: npt.NDArray[np.float64],
+    t_cold: float,
+    v_max: npt.NDArray[np.float64],
+    i_max: npt.NDArray[np.float64],
+    delta_t_max: npt.NDArray[np.float64],
+) -> tuple[
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+]:
+    """Calculate the operating points for arrays of currents, temps and module params.
+
+    The arrays are broadcast against each other, so the shape of the outputs is
+    controlled by the caller, e.g. `ThermoElectricCooler.operating_params_vec` uses
+    `[t_hot, current]` and `TECBank.sweep` uses `[module, t_hot, current]`. The
+    coefficients only depend on the module and hot side temp, so they're calculated
+    once per pair and then broadcast across the currents.
+    """
+    i = currents
+    r, s_m, k_m, fom = _broadcast_coeffs(t_hots, v_max, i_max, delta_t_max)
+    dt = t_hots - t_cold
+
+    voltages = s_m * dt + r * i
+    cooling_powers = (s_m * t_cold * i) - (0.5 * i**2 * r) - (k_m * dt)
+    cops = cooling_powers / (voltages * i)
+    figure_of_merits = np.broadcast_to(fom, voltages.shape)
+
+    return voltages, cooling_powers, cops, figure_of_merits
+
+
+def broadcast_ambient_temperatures(  # noqa: PLR0913
+    currents: npt.NDArray[np.float64],
+    t_hots: npt.NDArray[np.float64],
+    t_cold: float,
+    v_max: npt.NDArray[np.float64],
+    i_max: npt.NDArray[np.float64],
+    delta_t_max: npt.NDArray[np.float64],
+    hot_side_sink_rj: float,
+) -> npt.NDArray[np.float64]:
+    """Calculate the ambient temps [K] for arrays of currents, temps and module params.
+
+    Broadcast equivalent of `ThermoElectricCooler.ambient_temperature`, see
+    `broadcast_operating_params` for how the arrays are broadcast. The closed form
+    heat balance is used so the voltages and cooling powers aren't calculated.
+    """
+    i = currents
+    r, s_m, k_m, _ = _broadcast_coeffs(t_hots, v_max, i_max, delta_t_max)
+    dt = t_hots - t_cold
+
+    heat_rejected = (s_m * t_hots * i) + (0.5 * r * i**2) - (k_m * dt)
+    return t_hots - heat_rejected * hot_side_sink_rj
+
+
+def _broadcast_coeffs(
+    t_hots: npt.NDArray[np.float64],
+    v_max: npt.NDArray[np.float64],
+    i_max: npt.NDArray[np.float64],
+    delta_t_max: npt.NDArray[np.float64],
+) -> tuple[
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+]:
+    """Calc the coefficients (r, s_m, k_m, fom) for arrays of temps and module params.
+
+    Broadcast equivalent of `ThermoElectricCooler._calc_coeffs`.
+    """
+    t_hot_minus_d_t_m = t_hots - delta_t_max
+    r = t_hot_minus_d_t_m * v_max / (t_hots * i_max)
+    s_m = v_max / t_hots
+    k_m = t_hot_minus_d_t_m * v_max * i_max / (2 * t_hots * delta_t_max)
+    fom = 2 * delta_t_max / t_hot_minus_d_t_m**2
+    return r, s_m, k_m, fom
+
+
+@functools.cache
+def _load_kernels() -> ModuleType | None:
+    """Import the compiled kernels on first use, or None if numba isn't installed.
+
+    Importing numba is slow so it's deferred until a kernel is actually needed.
+    """
+    try:
+        from tec_model import _kernels  # noqa: PLC0415
+    except ImportError:  # numba is an optional dependency.
+        return None
+    return _kernels
+
+
+@functools.cache
+def select_backend() -> None:
+    """Use the non-interactive backend unless opted out with TEC_BATCH=0.
+
+    This stops batch runs on headless machines paying for loading a GUI toolkit. If the
+    caller has already imported pyplot their backend is left alone, as switching it
+    would close any figures they have open, so scripts should call this before
+    importing pyplot.
+    """
+    if (
+        os.environ.get("TEC_BATCH", "1") == "1"
+        and "matplotlib.pyplot" not in sys.modules
+    ):
+        import matplotlib as mpl  # noqa: PLC0415
+
+        mpl.use("Agg")
+
+
+def _plot_rows(  # noqa: PLR0913
+    ax: Axes,
+    currents: npt.NDArray[np.float64],
+    values: npt.NDArray[np.float64],
+    colors: npt.NDArray[np.float64],
+    handles: list[Line2D],
+    linestyle: LineStyleType,
+) -> None:
+    """Plot each row of `values` against `currents` as a line with markers.
+
+    All of the rows are drawn as a single `LineCollection` plus a single scatter for the
+    markers rather than one `Line2D` per row, so each axis only has two artists to draw.
+    Entries are appended to any existing legend so that several modules can share axes.
+    """
+    from matplotlib.collections import LineCollection  # noqa: PLC0415
+
+    points = np.broadcast_to(currents, values.shape)
+    segments = np.stack((points, values), axis=-1)
+    point_colors = np.repeat(colors, values.shape[1], axis=0)
+
+    # The stubs only allow a sequence of segments but an (N, P, 2) array is accepted.
+    lines = LineCollection(
+        segments,  # type: ignore[arg-type]
+        colors=colors,
+        linestyles=linestyle,
+        rasterized=True,
+    )
+    ax.add_collection(lines)
+    ax.scatter(
+        points.ravel(), values.ravel(), c=point_colors, marker="o", rasterized=True
+    )
+    ax.autoscale_view()
+
+    legend_handles: list[Artist] = list(handles)
+    labels = [handle.get_label() for handle in handles]
+    legend = ax.get_legend()
+    if legend is not None:
+        old_handles = [handle for handle in legend.legend_handles if handle is not None]
+        legend_handles = [*old_handles, *legend_handles]
+        labels = [*(text.get_text() for text in legend.get_texts()), *labels]
+    ax.legend(handles=legend_handles, labels=labels)
@@ -0,0 +1,61 @@
+# System imports
+from __future__ import annotations
+
+# Library imports
+import numpy as np
+
+# Local imports
+from tec_model.cui_devices_cp35 import CP35147, CP35347, CP353047, CP354047
+from tec_model.tec_bank import TECBank
+
+# Typing only imports
+
+T_COLD = 5 + 273.15
+CURRENTS = np.linspace(1, 5.0, 20)
+T_HOTS = np.linspace(27 + 273.15, 55 + 273.15, 6)
+MODELS = [CP35147, CP35347, CP353047, CP354047]
+
+
+def test__from_models() -> None:
+    """Unit test for packing TEC modules into a bank."""
+    bank = TECBank.from_models(MODELS)
+    assert len(bank) == len(MODELS)
+    assert bank.mfns == tuple(model.mfn for model in MODELS)
+    assert np.array_equal(bank.v_max, [model.v_max for model in MODELS])
+    assert bank.delta_t_max_50.dtype == np.float64
+
+
+def test__sweep() -> None:
+    """Unit test for the bank sweep against sweeping each module separately."""
+    results = TECBank.from_models(MODELS).sweep(
+        currents=CURRENTS, t_hots=T_HOTS, t_cold=T_COLD
+    )
+
+    for index, model in enumerate(MODELS):
+        expected = model.operating_params_vec(
+            currents=CURRENTS, t_hots=T_HOTS, t_cold=T_COLD
+        )
+        for result, expected_result in zip(results, expected, strict=True):
+            assert result.shape == (len(MODELS), len(T_HOTS), len(CURRENTS))
+            assert np.allclose(result[index], expected_result, rtol=1e-12)
+
+
+def test__ambient_temperatures() -> None:
+    """Unit test for the bank ambient temps against each module separately."""
+    hot_side_sink_rj = 0.5
+    results = TECBank.from_models(MODELS).ambient_temperatures(
+        currents=CURRENTS,
+        t_hots=T_HOTS,
+        t_cold=T_COLD,
+        hot_side_sink_rj=hot_side_sink_rj,
+    )
+    assert results.shape == (len(MODELS), len(T_HOTS), len(CURRENTS))
+
+    for index, model in enumerate(MODELS):
+        expected = model.ambient_temperature_vec(
+            currents=CURRENTS,
+            t_hots=T_HOTS,
+            t_cold=T_COLD,
+            hot_side_sink_rj=hot_side_sink_rj,
+        )
+        assert np.allclose(results[index], expected, rtol=1e-12)
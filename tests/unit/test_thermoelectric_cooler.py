@@ -0,0 +1,287 @@
+# System imports
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from typing import TYPE_CHECKING, Any
+
+# Library imports
+import numpy as np
+import pytest
+
+# Local imports
+from tec_model import thermoelectric_cooler
+from tec_model.cui_devices_cp35 import CP353047, CP354047
+from tec_model.thermoelectric_cooler import ThermoElectricCooler, select_backend
+
+# Typing only imports
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+    from matplotlib.typing import LineStyleType
+
+T_COLD = 5 + 273.15
+CURRENTS = np.linspace(1, 5.0, 20)
+T_HOTS = np.linspace(27 + 273.15, 55 + 273.15, 6)
+DATASHEET_VALUES: dict[str, object] = {
+    "mfn": "CP353047",
+    "datasheet_link": "https://www.cuidevices.com/product/resource/cp35.pdf",
+    "v_max": 11.8,
+    "i_max": 3.5,
+    "q_max_27": 24,
+    "q_max_50": 26.0,
+    "delta_t_max_27": 70,
+    "delta_t_max_50": 77.0,
+}
+
+
+def test__from_datasheet() -> None:
+    """Unit test for the from_datasheet constructor."""
+    tec = ThermoElectricCooler.from_datasheet(**DATASHEET_VALUES)
+    assert tec == CP353047
+    assert isinstance(tec.q_max_27, float)
+    assert isinstance(tec.delta_t_max_27, float)
+    assert ThermoElectricCooler.from_datasheet(**tec.model_dump()) == tec
+
+
+@pytest.mark.parametrize(
+    ("overrides", "error"),
+    [
+        ({"v_max": "11.8"}, TypeError),
+        ({"mfn": 353047}, TypeError),
+        ({"i_max": True}, TypeError),
+        ({"i_max": -3.5}, ValueError),
+        ({"delta_t_max_27": float("nan")}, ValueError),
+        ({"t_max": 1.0}, TypeError),
+    ],
+)
+def test__from_datasheet__invalid(
+    overrides: dict[str, object], error: type[Exception]
+) -> None:
+    """Unit test for the from_datasheet constructor rejecting bad datasheet values."""
+    with pytest.raises(error):
+        ThermoElectricCooler.from_datasheet(**(DATASHEET_VALUES | overrides))
+
+
+def test__operating_params_vec() -> None:
+    """Unit test for the operating_params_vec method against the scalar version."""
+    voltages, cooling_powers, cops, figure_of_merits = CP353047.operating_params_vec(
+        currents=CURRENTS, t_hots=T_HOTS, t_cold=T_COLD
+    )
+    assert voltages.shape == cooling_powers.shape == (len(T_HOTS), len(CURRENTS))
+    assert cops.shape == figure_of_merits.shape == (len(T_HOTS), len(CURRENTS))
+
+    for row, t_hot in enumerate(T_HOTS):
+        for col, current in enumerate(CURRENTS):
+            expected = CP353047.operating_params(
+                current=float(current), t_hot=float(t_hot), t_cold=T_COLD
+            )
+            actual = (
+                voltages[row, col],
+                cooling_powers[row, col],
+                cops[row, col],
+                figure_of_merits[row, col],
+            )
+            assert np.allclose(actual, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("use_kernels", [True, False])
+def test__operating_params_batch(
+    *, use_kernels: bool, monkeypatch: MonkeyPatch
+) -> None:
+    """Unit test for the operating_params_batch method with and without numba."""
+    if use_kernels:
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(thermoelectric_cooler, "_load_kernels", lambda: None)
+
+    voltages, cooling_powers, cops = CP353047.operating_params_batch(
+        currents=CURRENTS, t_hots=T_HOTS, t_cold=T_COLD
+    )
+    expected_voltages, expected_cooling_powers, expected_cops, _ = (
+        CP353047.operating_params_vec(currents=CURRENTS, t_hots=T_HOTS, t_cold=T_COLD)
+    )
+    assert np.allclose(voltages, expected_voltages, rtol=1e-12)
+    assert np.allclose(cooling_powers, expected_cooling_powers, rtol=1e-12)
+    assert np.allclose(cops, expected_cops, rtol=1e-12)
+
+
+def test__operating_params() -> None:
+    """Unit test for operating_params against the single quantity methods."""
+    for t_hot in T_HOTS:
+        for current in CURRENTS:
+            kwargs: dict[str, float] = {
+                "current": float(current),
+                "t_hot": float(t_hot),
+                "t_cold": T_COLD,
+            }
+            voltage, cooling_power, cop, figure_of_merit = CP353047.operating_params(
+                **kwargs
+            )
+            assert np.isclose(voltage, CP353047.voltage(**kwargs), rtol=1e-12)
+            assert np.isclose(
+                cooling_power, CP353047.cooling_power(**kwargs), rtol=1e-12
+            )
+            assert np.isclose(
+                cop, CP353047.coefficient_of_performance(**kwargs), rtol=1e-12
+            )
+            assert figure_of_merit == CP353047.figure_of_merit(t_hot=float(t_hot))
+
+
+def test__single_quantities__array_currents() -> None:
+    """Unit test for the single quantity methods with an array of currents."""
+    t_hot = float(T_HOTS[0])
+    voltages, cooling_powers, cops, _ = CP353047.operating_params_vec(
+        currents=CURRENTS, t_hots=[t_hot], t_cold=T_COLD
+    )
+    kwargs: dict[str, Any] = {"current": CURRENTS, "t_hot": t_hot, "t_cold": T_COLD}
+    assert np.allclose(CP353047.voltage(**kwargs), voltages[0], rtol=1e-12)
+    assert np.allclose(CP353047.cooling_power(**kwargs), cooling_powers[0], rtol=1e-12)
+    assert np.allclose(
+        CP353047.coefficient_of_performance(**kwargs), cops[0], rtol=1e-12
+    )
+
+    # The coefficients for an array of hot side temps can't be cached.
+    voltages, cooling_powers, cops, _ = CP353047.operating_params_vec(
+        currents=[2.0], t_hots=T_HOTS, t_cold=T_COLD
+    )
+    kwargs = {"current": 2.0, "t_hot": T_HOTS, "t_cold": T_COLD}
+    assert np.allclose(CP353047.voltage(**kwargs), voltages[:, 0], rtol=1e-12)
+    assert np.allclose(
+        CP353047.cooling_power(**kwargs), cooling_powers[:, 0], rtol=1e-12
+    )
+    assert np.allclose(
+        CP353047.coefficient_of_performance(**kwargs), cops[:, 0], rtol=1e-12
+    )
+    t_ambients = CP353047.ambient_temperature(**kwargs, hot_side_sink_rj=0.5)
+    expected = T_HOTS - (voltages[:, 0] * 2.0 + cooling_powers[:, 0]) * 0.5
+    assert np.allclose(t_ambients, expected, rtol=1e-12)
+
+
+def test__ambient_temperature() -> None:
+    """Unit test for ambient_temperature against the full heat balance."""
+    hot_side_sink_rj = 0.5
+    for t_hot in T_HOTS:
+        for current in CURRENTS:
+            kwargs: dict[str, float] = {
+                "current": float(current),
+                "t_hot": float(t_hot),
+                "t_cold": T_COLD,
+            }
+            voltage, cooling_power, _, _ = CP353047.operating_params(**kwargs)
+            expected = t_hot - (voltage * current + cooling_power) * hot_side_sink_rj
+            t_ambient = CP353047.ambient_temperature(
+                **kwargs, hot_side_sink_rj=hot_side_sink_rj
+            )
+            assert np.isclose(t_ambient, expected, rtol=1e-12)
+
+
+def test__plot_operating_regions__shared_axes(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Unit test for plotting two modules into a shared grid of axes."""
+    select_backend()
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
+    monkeypatch.chdir(tmp_path)
+    hot_side_sink_rj = 0.5
+    tecs = [CP353047, CP354047]
+    linestyles: list[LineStyleType] = ["-", "--"]
+    fig, axes = plt.subplots(2, 3)
+    try:
+        for tec, linestyle in zip(tecs, linestyles, strict=True):
+            tec.plot_operating_regions(
+                t_cold=T_COLD,
+                currents=CURRENTS,
+                t_hots=T_HOTS,
+                hot_side_sink_rj=hot_side_sink_rj,
+                ax_grid=axes.flat,
+                linestyle=linestyle,
+            )
+
+        prefixes = [f"{tec.mfn} Th = " for tec in tecs for _ in T_HOTS]
+        for ax in axes.flat[:5]:
+            labels = [text.get_text() for text in ax.get_legend().get_texts()]
+            assert len(labels) == len(tecs) * len(T_HOTS)
+            for label, prefix in zip(labels, prefixes, strict=True):
+                assert label.startswith(prefix)
+
+        ax4 = axes.flat[3]
+        scatters = ax4.collections[1::2]
+        for tec, scatter in zip(tecs, scatters, strict=True):
+            voltages, cooling_powers, _, _ = tec.operating_params_vec(
+                currents=CURRENTS, t_hots=T_HOTS, t_cold=T_COLD
+            )
+            expected = (
+                T_HOTS[:, np.newaxis]
+                - (voltages * CURRENTS + cooling_powers) * hot_side_sink_rj
+                - 273.15
+            )
+            offsets = np.asarray(scatter.get_offsets())
+            assert np.allclose(offsets[:, 0], np.tile(CURRENTS, len(T_HOTS)))
+            assert np.allclose(offsets[:, 1], expected.ravel(), rtol=1e-12)
+    finally:
+        plt.close(fig)
+
+    # Saving the figure is left to the caller when the axes are passed in.
+    assert not any(tmp_path.iterdir())
+
+
+def test__ambient_temperature_vec() -> None:
+    """Unit test for ambient_temperature_vec against the full heat balance."""
+    hot_side_sink_rj = 0.5
+    voltages, cooling_powers, _, _ = CP353047.operating_params_vec(
+        currents=CURRENTS, t_hots=T_HOTS, t_cold=T_COLD
+    )
+    expected = (
+        T_HOTS[:, np.newaxis]
+        - (voltages * CURRENTS + cooling_powers) * hot_side_sink_rj
+    )
+    t_ambients = CP353047.ambient_temperature_vec(
+        currents=CURRENTS,
+        t_hots=T_HOTS,
+        t_cold=T_COLD,
+        hot_side_sink_rj=hot_side_sink_rj,
+    )
+    assert np.allclose(t_ambients, expected, rtol=1e-12)
+
+
+def test__import_skips_matplotlib() -> None:
+    """Unit test that the compute only API doesn't import matplotlib or numba."""
+    code = (
+        "import sys; import tec_model.thermoelectric_cooler; "
+        "assert 'matplotlib' not in sys.modules; assert 'numba' not in sys.modules"
+    )
+    env = os.environ | {"PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)  # noqa: S603
+
+
+def test__operating_params__cache() -> None:
+    """Unit test for the caching of operating_params."""
+    ThermoElectricCooler.cache_clear()
+    first = CP353047.operating_params(current=2.0, t_hot=310.0, t_cold=T_COLD)
+    second = CP353047.operating_params(current=2.0, t_hot=310.0, t_cold=T_COLD)
+    assert first is second
+
+    ThermoElectricCooler.cache_clear()
+    third = CP353047.operating_params(current=2.0, t_hot=310.0, t_cold=T_COLD)
+    assert third == first
+    assert third is not first
+    ThermoElectricCooler.cache_clear()
+
+
+def test__operating_params__arrays() -> None:
+    """Unit test for operating_params with arrays, which bypass the cache."""
+    expected = CP353047.operating_params_vec(
+        currents=CURRENTS, t_hots=T_HOTS, t_cold=T_COLD
+    )
+    kwargs: dict[str, Any] = {
+        "current": CURRENTS,
+        "t_hot": T_HOTS[:, np.newaxis],
+        "t_cold": T_COLD,
+    }
+    actual = CP353047.operating_params(**kwargs)
+    for actual_values, expected_values in zip(actual, expected, strict=True):
+        assert np.allclose(actual_values, expected_values, rtol=1e-12)